@@ -48,7 +48,7 @@ def run_data_cleaning(file_path=None):
     print("✅ Automatic cleaning completed.")
 
     # 6️⃣ Validate cleaned data
-    validation_issues = validate_data(df_clean)
+    validation_issues = validate_data(df_clean, config)
     print("✅ Validation completed.")
 
     # 7️⃣ Generate AI-powered suggestions
@@ -1,39 +1,331 @@
+import re
+import numpy as np
 import pandas as pd
 
-def validate_data(df):
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_SAMPLE_SIZE = 5
+
+CHECK_TYPES = ("not_null", "range", "unique", "regex", "allowed_values", "equation")
+REQUIRED_KEYS = {
+    "not_null": ("column",),
+    "range": ("column",),
+    "unique": ("column",),
+    "regex": ("column", "pattern"),
+    "allowed_values": ("column", "values"),
+    "equation": ("columns", "target"),
+}
+LIST_KEYS = ("values", "columns")
+EQUATION_OPS = {
+    "multiply": np.multiply,
+    "add": np.add,
+    "subtract": np.subtract,
+}
+
+# Used when the config has no 'validation' section.
+DEFAULT_CHECKS = [
+    {"type": "not_null", "column": "Transaction Date"},
+    {"type": "range", "column": "Quantity", "min": 0},
+    {"type": "range", "column": "Price Per Unit", "min": 0},
+    {"type": "range", "column": "Total Spent", "min": 0},
+]
+
+
+def _label(spec):
+    """Human readable name for a check spec."""
+    if spec.get("name"):
+        return spec["name"]
+    if spec["type"] == "equation":
+        return f"{spec.get('op', 'multiply')}({', '.join(map(str, spec.get('columns') or []))}) = {spec.get('target')}"
+    if spec["type"] == "range":
+        return f"{spec.get('column')} range [{spec.get('min')}, {spec.get('max')}]"
+    return f"{spec.get('column')} {spec['type']}"
+
+
+def _coerce_bound(value, dtype):
+    """Convert a range bound from config to something comparable with the column."""
+    if value is None:
+        return None
+    if not pd.api.types.is_datetime64_any_dtype(dtype):
+        return float(value)
+
+    bound = pd.Timestamp(value)
+    tz = getattr(dtype, "tz", None)
+    if tz is not None:
+        return bound.tz_localize(tz) if bound.tz is None else bound.tz_convert(tz)
+    return bound.tz_convert("UTC").tz_localize(None) if bound.tz is not None else bound
+
+
+# Evaluators are called as evaluate(chunk, rows, state): 'rows' is the positional
+# slice of the chunk within df and 'state' is what the check's optional prepare(df)
+# returned for the current run, so compiled checks can be reused across runs.
+
+def _not_null_check(col):
+    def evaluate(chunk, rows, state):
+        return chunk[col].isna().to_numpy()
+
+    return evaluate
+
+
+def _range_check(col, low, high):
+    def evaluate(chunk, rows, state):
+        values = chunk[col]
+        mask = np.zeros(len(values), dtype=bool)
+        if low is not None:
+            mask |= (values < low).to_numpy(dtype=bool, na_value=False)
+        if high is not None:
+            mask |= (values > high).to_numpy(dtype=bool, na_value=False)
+        return mask
+
+    return evaluate
+
+
+def _unique_prepare(col):
+    def prepare(df):
+        values = df[col]
+        return (values.duplicated() & values.notna()).to_numpy()
+
+    return prepare
+
+
+def _unique_check(col):
+    # Duplicates are flagged over the whole column up front (see _unique_prepare),
+    # so matches spanning chunk boundaries are caught without per-chunk lookups.
+    def evaluate(chunk, rows, state):
+        return state[rows]
+
+    return evaluate
+
+
+def _regex_check(col, pattern):
+    def evaluate(chunk, rows, state):
+        values = chunk[col]
+        matched = values.astype("string").str.fullmatch(pattern)
+        return values.notna().to_numpy() & ~matched.to_numpy(dtype=bool, na_value=False)
+
+    return evaluate
+
+
+def _allowed_values_check(col, allowed):
+    def evaluate(chunk, rows, state):
+        values = chunk[col]
+        return values.notna().to_numpy() & ~values.isin(allowed).to_numpy()
+
+    return evaluate
+
+
+def _equation_check(columns, target, op, tolerance):
+    func = EQUATION_OPS[op]
+
+    def evaluate(chunk, rows, state):
+        operands = chunk[columns].to_numpy(dtype=float, na_value=np.nan)
+        result = func.reduce(operands, axis=1)
+        expected = chunk[target].to_numpy(dtype=float, na_value=np.nan)
+        # NaN comparisons are False, so rows with a missing operand are skipped.
+        return np.abs(result - expected) > tolerance
+
+    return evaluate
+
+
+def compile_checks(df, check_specs):
+    """
+    Turn declarative check specs (from config) into vectorized evaluators.
+    Returns (compiled_checks, issues) where issues lists specs that cannot
+    run against this dataframe (malformed spec, non-numeric columns).
+    Specs referring to absent columns are skipped silently, so one config can
+    serve several feeds; set 'required: true' on a spec to report it instead.
+    """
+    compiled, issues = [], []
+
+    if check_specs is None:
+        return compiled, issues
+    if not isinstance(check_specs, list):
+        issues.append(f"Validation checks must be a list, got {type(check_specs).__name__}.")
+        return compiled, issues
+
+    for spec in check_specs:
+        if not isinstance(spec, dict):
+            issues.append(f"Validation check {spec!r} skipped: expected a mapping.")
+            continue
+        ctype = spec.get("type")
+        if ctype not in CHECK_TYPES:
+            issues.append(f"Unknown validation check type: {ctype!r}.")
+            continue
+
+        label = _label(spec)
+        absent_keys = [k for k in REQUIRED_KEYS[ctype] if spec.get(k) is None]
+        if absent_keys:
+            issues.append(f"Validation check '{label}' skipped: missing key(s) {absent_keys}.")
+            continue
+        not_lists = [k for k in LIST_KEYS if k in spec and not isinstance(spec[k], list)]
+        if not_lists:
+            issues.append(f"Validation check '{label}' skipped: key(s) {not_lists} must be lists.")
+            continue
+
+        if ctype == "equation":
+            columns = list(spec["columns"]) + [spec["target"]]
+        else:
+            columns = [spec["column"]]
+        missing = [c for c in columns if c not in df.columns]
+        if missing:
+            if spec.get("required"):
+                issues.append(f"Validation check '{label}' skipped: column(s) {missing} not found.")
+            continue
+
+        prepare = None
+        if ctype == "not_null":
+            evaluate = _not_null_check(spec["column"])
+        elif ctype == "range":
+            col = spec["column"]
+            dtype = df[col].dtype
+            if not (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype)):
+                issues.append(f"{col} is not numeric.")
+                continue
+            try:
+                low = _coerce_bound(spec.get("min"), dtype)
+                high = _coerce_bound(spec.get("max"), dtype)
+            except (TypeError, ValueError) as e:
+                issues.append(f"Validation check '{label}' skipped: invalid min/max ({e}).")
+                continue
+            evaluate = _range_check(col, low, high)
+        elif ctype == "unique":
+            prepare = _unique_prepare(spec["column"])
+            evaluate = _unique_check(spec["column"])
+        elif ctype == "regex":
+            try:
+                re.compile(spec["pattern"])
+            except (TypeError, re.error) as e:
+                issues.append(f"Validation check '{label}' skipped: invalid pattern ({e}).")
+                continue
+            evaluate = _regex_check(spec["column"], spec["pattern"])
+        elif ctype == "allowed_values":
+            evaluate = _allowed_values_check(spec["column"], spec["values"])
+        else:
+            op = spec.get("op", "multiply")
+            if op not in EQUATION_OPS:
+                issues.append(f"Validation check '{label}' skipped: unsupported op {op!r}.")
+                continue
+            non_numeric = [c for c in columns if not pd.api.types.is_numeric_dtype(df[c])]
+            if non_numeric:
+                issues.append(f"Validation check '{label}' skipped: column(s) {non_numeric} not numeric.")
+                continue
+            try:
+                tolerance = float(spec.get("tolerance", 0.0))
+            except (TypeError, ValueError) as e:
+                issues.append(f"Validation check '{label}' skipped: invalid tolerance ({e}).")
+                continue
+            evaluate = _equation_check(spec["columns"], spec["target"], op, tolerance)
+
+        compiled.append({"name": label, "evaluate": evaluate, "prepare": prepare})
+
+    return compiled, issues
+
+
+def run_checks(df, compiled_checks, chunk_size=DEFAULT_CHUNK_SIZE, sample_size=DEFAULT_SAMPLE_SIZE):
+    """
+    Evaluate all compiled checks in a single pass over the dataframe, chunk by chunk.
+    Missing values and duplicate rows are counted alongside.
+    Returns a dict with 'missing_values', 'duplicate_rows' and 'checks', a list
+    of per-check results in spec order ({'name', 'failed', 'sample_rows'}).
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+
+    # Per-run state lives here, not in the compiled checks, so they can be reused.
+    states = [c["prepare"](df) if c.get("prepare") else None for c in compiled_checks]
+    counts = np.zeros(len(compiled_checks), dtype=np.int64)
+    samples = [[] for _ in compiled_checks]
+    missing_total = 0
+    dup_count = int(df.duplicated().sum())
+
+    for start in range(0, len(df), chunk_size):
+        rows = slice(start, start + chunk_size)
+        chunk = df.iloc[rows]
+        missing_total += int(chunk.isna().to_numpy().sum())
+
+        if not compiled_checks:
+            continue
+
+        failures = np.column_stack([
+            c["evaluate"](chunk, rows, state) for c, state in zip(compiled_checks, states)
+        ])
+        chunk_counts = failures.sum(axis=0)
+        counts += chunk_counts
+        for i in np.flatnonzero(chunk_counts):
+            need = sample_size - len(samples[i])
+            if need > 0:
+                positions = np.flatnonzero(failures[:, i])[:need]
+                samples[i].extend(chunk.index[positions].tolist())
+
+    return {
+        "missing_values": missing_total,
+        "duplicate_rows": dup_count,
+        "checks": [
+            {"name": c["name"], "failed": int(counts[i]), "sample_rows": samples[i]}
+            for i, c in enumerate(compiled_checks)
+        ],
+    }
+
+
+def _size_setting(value, default, minimum):
+    """
+    Read a chunk/sample size from config: default when unset, the value when
+    it is an int >= minimum, otherwise None to signal an invalid setting.
+    """
+    if value is None:
+        return default
+    if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+        return None
+    return value
+
+
+def validate_data(df, config=None):
     """
     Run validations and return a list of issues (empty list if none).
+    Checks are read from config['validation']['checks']; see
+    config/cleaning_rules.yaml for the supported check types. Without a
+    'validation' section, DEFAULT_CHECKS are applied.
     """
-    issues = []
     if df is None:
         return ["No dataframe provided to validate."]
 
-    # 1. Missing values total
-    missing_total = int(df.isnull().sum().sum())
-    if missing_total > 0:
-        issues.append(f"Dataset contains {missing_total} missing values total.")
+    settings = (config or {}).get("validation")
+    if settings is None:
+        compiled, issues = compile_checks(df, DEFAULT_CHECKS)
+        settings = {}
+    elif not isinstance(settings, dict):
+        compiled = []
+        issues = [f"Validation settings must be a mapping, got {type(settings).__name__}; no checks run."]
+        settings = {}
+    else:
+        compiled, issues = compile_checks(df, settings.get("checks"))
 
-    # 2. Duplicates check
-    dup_count = int(df.duplicated().sum())
-    if dup_count > 0:
-        issues.append(f"Dataset contains {dup_count} duplicate rows.")
-
-    # 3. Transaction Date sanity (if exists)
-    if 'Transaction Date' in df.columns:
-        # Count NaT
-        nat_count = int(df['Transaction Date'].isna().sum())
-        if nat_count > 0:
-            issues.append(f"Transaction Date contains {nat_count} NaT (invalid/missing dates).")
-
-    # 4. Numeric sanity
-    for col in ['Quantity', 'Price Per Unit', 'Total Spent']:
-        if col in df.columns:
-            # non-numeric or negative checks
-            if not pd.api.types.is_numeric_dtype(df[col]):
-                issues.append(f"{col} is not numeric.")
-            else:
-                negs = int((df[col] < 0).sum())
-                if negs > 0:
-                    issues.append(f"{col} contains {negs} negative values.")
+    chunk_size = _size_setting(settings.get("chunk_size"), DEFAULT_CHUNK_SIZE, minimum=1)
+    if chunk_size is None:
+        issues.append(
+            f"Invalid validation chunk_size {settings.get('chunk_size')!r}; "
+            f"using {DEFAULT_CHUNK_SIZE}."
+        )
+        chunk_size = DEFAULT_CHUNK_SIZE
+    sample_size = _size_setting(settings.get("sample_size"), DEFAULT_SAMPLE_SIZE, minimum=0)
+    if sample_size is None:
+        issues.append(
+            f"Invalid validation sample_size {settings.get('sample_size')!r}; "
+            f"using {DEFAULT_SAMPLE_SIZE}."
+        )
+        sample_size = DEFAULT_SAMPLE_SIZE
+
+    results = run_checks(df, compiled, chunk_size=chunk_size, sample_size=sample_size)
+
+    if results["missing_values"] > 0:
+        issues.append(f"Dataset contains {results['missing_values']} missing values total.")
+    if results["duplicate_rows"] > 0:
+        issues.append(f"Dataset contains {results['duplicate_rows']} duplicate rows.")
+
+    for result in results["checks"]:
+        if result["failed"] > 0:
+            issues.append(
+                f"Check '{result['name']}' failed for {result['failed']} rows "
+                f"(sample rows: {result['sample_rows']})."
+            )
 
     return issues
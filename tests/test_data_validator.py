@@ -0,0 +1,179 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from src.data_validator import compile_checks, run_checks, validate_data
+
+CHECKS = [
+    {"type": "not_null", "column": "a"},
+    {"type": "unique", "column": "a"},
+    {"type": "range", "column": "qty", "min": 0, "max": 10},
+    {"type": "range", "column": "when", "min": "2024-01-01", "max": "2024-12-31"},
+    {"type": "regex", "column": "code", "pattern": r"X\d+"},
+    {"type": "allowed_values", "column": "code", "values": ["X1", "X2", "X3"]},
+    {"type": "equation", "name": "qty x price = total",
+     "columns": ["qty", "price"], "target": "total", "tolerance": 0.01},
+]
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "a": [1, 2, 3, 1, np.nan, 2, 7, np.nan],
+        "qty": [1, 2, -1, 4, 5, 11, 2, np.nan],
+        "price": [1.0, 2.0, 3.0, 1.0, np.nan, 1.0, 2.0, 1.0],
+        "total": [1.0, 4.0, -3.0, 5.0, 10.0, 11.0, 4.0, 1.0],
+        "when": pd.to_datetime([
+            "2024-01-05", "2023-12-31", "2024-06-01", None,
+            "2025-01-02", "2024-03-03", "2024-04-04", "2024-05-05",
+        ]),
+        "code": ["X1", "X2", "Y9", None, "X12", "X3", "x1", "X2"],
+    })
+
+
+CONFIG_PATH = Path(__file__).resolve().parents[1] / "config" / "cleaning_rules.yaml"
+
+
+def _run(df, chunk_size):
+    compiled, issues = compile_checks(df, CHECKS)
+    assert issues == []
+    return run_checks(df, compiled, chunk_size=chunk_size)
+
+
+def _by_name(results):
+    return {r["name"]: {"failed": r["failed"], "sample_rows": r["sample_rows"]} for r in results["checks"]}
+
+
+def test_results_independent_of_chunk_size(df):
+    expected = _run(df, chunk_size=len(df))
+    for chunk_size in (1, 2, 3, 5):
+        assert _run(df, chunk_size) == expected
+
+
+def test_expected_failures(df):
+    checks = _by_name(_run(df, chunk_size=3))
+    assert checks["a not_null"] == {"failed": 2, "sample_rows": [4, 7]}
+    # Duplicates of rows 0 and 1 sit in later chunks; NaNs are not duplicates.
+    assert checks["a unique"] == {"failed": 2, "sample_rows": [3, 5]}
+    assert checks["qty range [0, 10]"]["sample_rows"] == [2, 5]
+    assert checks["when range [2024-01-01, 2024-12-31]"]["sample_rows"] == [1, 4]
+    assert checks["code regex"]["sample_rows"] == [2, 6]
+    assert checks["code allowed_values"]["sample_rows"] == [2, 4, 6]
+    # Row 3 mismatches; rows 4 and 7 have a missing operand and are skipped.
+    assert checks["qty x price = total"]["sample_rows"] == [3]
+
+
+def test_compiled_checks_are_reusable(df):
+    compiled, _ = compile_checks(df, CHECKS)
+    first = run_checks(df, compiled, chunk_size=2)
+    assert run_checks(df, compiled, chunk_size=2) == first
+
+
+def test_sample_size_limits_indices_not_count():
+    df = pd.DataFrame({"a": [np.nan] * 10})
+    compiled, _ = compile_checks(df, [{"type": "not_null", "column": "a"}])
+    result = run_checks(df, compiled, chunk_size=3, sample_size=2)["checks"][0]
+    assert result == {"name": "a not_null", "failed": 10, "sample_rows": [0, 1]}
+
+
+def test_duplicate_rows_and_missing_values_across_chunks():
+    df = pd.DataFrame({"a": [1, 2, 1, np.nan], "b": ["x", "y", "x", None]})
+    for chunk_size in (1, 2, 4):
+        results = run_checks(df, [], chunk_size=chunk_size)
+        assert results["duplicate_rows"] == 1
+        assert results["missing_values"] == 2
+
+
+@pytest.mark.parametrize("spec", [
+    {"type": "regex", "column": "n"},
+    {"type": "range", "column": "n", "min": "zero"},
+    {"type": "equation", "columns": ["n"], "target": "n", "op": "divide"},
+    {"type": "bogus", "column": "n"},
+    {"type": "not_null", "column": "missing", "required": True},
+    {"type": "allowed_values", "column": "n", "values": "xy"},
+    {"type": "equation", "columns": "n", "target": "n"},
+    "not_null",
+])
+def test_malformed_specs_are_reported(spec):
+    df = pd.DataFrame({"n": [1, 2]})
+    compiled, issues = compile_checks(df, [spec])
+    assert compiled == []
+    assert len(issues) == 1
+
+
+@pytest.mark.parametrize("validation", [[], "checks", {"checks": "not_null"}])
+def test_malformed_validation_settings_are_reported(validation):
+    issues = validate_data(pd.DataFrame({"n": [1, 2]}), {"validation": validation})
+    assert len(issues) == 1
+
+
+def test_checks_on_absent_columns_are_skipped():
+    df = pd.DataFrame({"Model": ["i3", "X5"], "Price_USD": [40000, 90000]})
+    config = yaml.safe_load(CONFIG_PATH.read_text(encoding="utf-8"))
+    assert validate_data(df, config) == []
+
+
+def test_same_type_checks_on_one_column_are_kept_apart():
+    df = pd.DataFrame({"q": [-1, 50, 3]})
+    issues = validate_data(df, {"validation": {"checks": [
+        {"type": "range", "column": "q", "min": 0},
+        {"type": "range", "column": "q", "max": 20},
+    ]}})
+    assert issues == [
+        "Check 'q range [0, None]' failed for 1 rows (sample rows: [0]).",
+        "Check 'q range [None, 20]' failed for 1 rows (sample rows: [1]).",
+    ]
+
+
+def test_range_bounds_are_coerced():
+    df = pd.DataFrame({
+        "n": [1, 5],
+        "ts": pd.to_datetime(["2024-01-01", "2024-06-01"]).tz_localize("UTC"),
+    })
+    compiled, issues = compile_checks(df, [
+        {"type": "range", "column": "n", "min": "2"},
+        {"type": "range", "column": "ts", "max": "2024-03-01"},
+    ])
+    assert issues == []
+    first, second = run_checks(df, compiled)["checks"]
+    assert first["sample_rows"] == [0]
+    assert second["sample_rows"] == [1]
+
+
+def test_invalid_chunk_size_is_reported():
+    df = pd.DataFrame({"n": [1, 1]})
+    issues = validate_data(df, {"validation": {"chunk_size": 0, "checks": []}})
+    assert any("chunk_size" in i for i in issues)
+    assert "Dataset contains 1 duplicate rows." in issues
+
+
+def test_default_checks_without_config():
+    df = pd.DataFrame({
+        "Quantity": [1, -2],
+        "Total Spent": ["a", "b"],
+        "Transaction Date": pd.to_datetime(["2024-01-01", None]),
+    })
+    issues = validate_data(df)
+    assert "Total Spent is not numeric." in issues
+    assert any(i.startswith("Check 'Quantity range [0, None]' failed for 1 rows") for i in issues)
+    assert any(i.startswith("Check 'Transaction Date not_null' failed for 1 rows") for i in issues)
+    assert not any("Price Per Unit" in i for i in issues)
+
+
+def test_duplicate_rows_with_unhashable_values():
+    df = pd.DataFrame({"a": [[1], [1], [2]]})
+    assert run_checks(df, [])["duplicate_rows"] == 1
+
+
+@pytest.mark.parametrize("values, expected", [
+    ([1, "1"], 0),
+    ([True, "True"], 0),
+    ([None, np.nan], 0),
+    ([0.0, -0.0], 1),
+])
+def test_duplicate_rows_match_dataframe_duplicated(values, expected):
+    df = pd.DataFrame({"a": pd.Series(values, dtype=object)})
+    assert run_checks(df, [])["duplicate_rows"] == int(df.duplicated().sum()) == expected